@@ -4,6 +4,12 @@
 import { ErrorCode, McpError } from "@modelcontextprotocol/sdk/types.js";
 import { AnkiClient } from "./utils.js";
 
+/**
+ * Matches note type resource URIs, e.g. anki://note-types/Basic
+ */
+const NOTE_TYPE_URI_PATTERN = /^anki:\/\/note-types\/(.+)$/;
+const WHITESPACE_PATTERN = /\s+/g;
+
 /**
  * Handles all MCP resource operations for Anki
  */
@@ -33,8 +39,6 @@ export class McpResourceHandler {
 			mimeType?: string;
 		}[];
 	}> {
-		await this.ankiClient.checkConnection();
-
 		return {
 			resources: [
 				{
@@ -58,8 +62,6 @@ export class McpResourceHandler {
 			mimeType?: string;
 		}[];
 	}> {
-		await this.ankiClient.checkConnection();
-
 		return {
 			resourceTemplates: [
 				{
@@ -101,7 +103,6 @@ export class McpResourceHandler {
 			text: string;
 		}[];
 	}> {
-		await this.ankiClient.checkConnection();
 		if (uri === "anki://decks/all") {
 			const decks = await this.ankiClient.getDeckNames();
 			return {
@@ -162,7 +163,7 @@ export class McpResourceHandler {
 			};
 		}
 
-		const noteTypeMatch = uri.match(/^anki:\/\/note-types\/(.+)$/);
+		const noteTypeMatch = uri.match(NOTE_TYPE_URI_PATTERN);
 		if (noteTypeMatch) {
 			const modelName = decodeURIComponent(noteTypeMatch[1]);
 			try {
@@ -178,7 +179,7 @@ export class McpResourceHandler {
 									fields: schema.fields,
 									templates: schema.templates,
 									css: schema.css,
-									createTool: `create_${modelName.replace(/\s+/g, "_")}_note`,
+									createTool: `create_${modelName.replace(WHITESPACE_PATTERN, "_")}_note`,
 								},
 								null,
 								2,
@@ -199,8 +200,14 @@ export class McpResourceHandler {
 
 	/**
 	 * Get schema for a specific model
+	 *
+	 * @param modelName Name of the model
+	 * @param modelNames Already fetched model names, to skip another lookup
 	 */
-	private async getModelSchema(modelName: string): Promise<ModelSchema> {
+	private async getModelSchema(
+		modelName: string,
+		modelNames?: string[],
+	): Promise<ModelSchema> {
 		if (!modelName) {
 			throw new McpError(ErrorCode.InvalidParams, "Model name is required");
 		}
@@ -213,7 +220,8 @@ export class McpResourceHandler {
 		}
 
 		// Check if model exists
-		const existingModels = await this.ankiClient.getModelNames();
+		const existingModels =
+			modelNames ?? (await this.ankiClient.getModelNames());
 		if (!existingModels.includes(modelName)) {
 			throw new McpError(
 				ErrorCode.InvalidParams,
@@ -257,7 +265,7 @@ export class McpResourceHandler {
 
 		const modelNames = await this.ankiClient.getModelNames();
 		const schemas = await Promise.all(
-			modelNames.map((modelName) => this.getModelSchema(modelName)),
+			modelNames.map((modelName) => this.getModelSchema(modelName, modelNames)),
 		);
 
 		// Update cache
@@ -5,271 +5,341 @@ import { ErrorCode, McpError } from "@modelcontextprotocol/sdk/types.js";
 import { AnkiClient } from "./utils.js";
 
 /**
- * Handles all MCP tool operations for Anki
+ * Matches dynamic model-specific tool names, e.g. create_Basic_note
  */
-export class McpToolHandler {
-	private ankiClient: AnkiClient;
+const MODEL_NOTE_TOOL_PATTERN = /^create_(.+)_note$/;
+const UNDERSCORE_PATTERN = /_/g;
 
-	constructor() {
-		this.ankiClient = new AnkiClient();
+/**
+ * Recursively freeze an object so a shared constant cannot be mutated
+ */
+function deepFreeze<T>(value: T): T {
+	if (value && typeof value === "object" && !Object.isFrozen(value)) {
+		Object.freeze(value);
+		for (const child of Object.values(value)) {
+			deepFreeze(child);
+		}
 	}
+	return value;
+}
 
-	/**
-	 * Get tool schema for all available tools
-	 */
-	async getToolSchema(): Promise<{
-		tools: {
-			name: string;
-			description: string;
-			inputSchema: Record<string, any>;
-		}[];
-	}> {
-		return {
-			tools: [
-				{
-					name: "list_decks",
-					description: "List all available Anki decks",
-					inputSchema: {
-						type: "object",
-						properties: {},
-						required: [],
+/**
+ * Tool definitions advertised to MCP clients, built and frozen once at
+ * module load
+ */
+const TOOL_SCHEMA: {
+	tools: {
+		name: string;
+		description: string;
+		inputSchema: Record<string, any>;
+	}[];
+} = deepFreeze({
+	tools: [
+		{
+			name: "list_decks",
+			description: "List all available Anki decks",
+			inputSchema: {
+				type: "object",
+				properties: {},
+				required: [],
+			},
+		},
+		{
+			name: "create_deck",
+			description: "Create a new Anki deck",
+			inputSchema: {
+				type: "object",
+				properties: {
+					name: {
+						type: "string",
+						description: "Name of the deck to create",
 					},
 				},
-				{
-					name: "create_deck",
-					description: "Create a new Anki deck",
-					inputSchema: {
-						type: "object",
-						properties: {
-							name: {
-								type: "string",
-								description: "Name of the deck to create",
-							},
-						},
-						required: ["name"],
+				required: ["name"],
+			},
+		},
+		{
+			name: "get_note_type_info",
+			description: "Get detailed structure of a note type",
+			inputSchema: {
+				type: "object",
+				properties: {
+					modelName: {
+						type: "string",
+						description: "Name of the note type/model",
+					},
+					includeCss: {
+						type: "boolean",
+						description: "Whether to include CSS information",
 					},
 				},
-				{
-					name: "get_note_type_info",
-					description: "Get detailed structure of a note type",
-					inputSchema: {
+				required: ["modelName"],
+			},
+		},
+		{
+			name: "create_note",
+			description:
+				"Create a new note (LLM Should call get_note_type_info first)",
+			inputSchema: {
+				type: "object",
+				properties: {
+					type: {
+						type: "string",
+						description: "Note type",
+					},
+					deck: {
+						type: "string",
+						description: "Deck name",
+					},
+					fields: {
 						type: "object",
-						properties: {
-							modelName: {
-								type: "string",
-								description: "Name of the note type/model",
-							},
-							includeCss: {
-								type: "boolean",
-								description: "Whether to include CSS information",
-							},
+						description:
+							"Custom fields for the note(get note type info first)",
+						additionalProperties: true,
+					},
+					allowDuplicate: {
+						type: "boolean",
+						description: "Whether to allow duplicate notes",
+					},
+					tags: {
+						type: "array",
+						items: {
+							type: "string",
 						},
-						required: ["modelName"],
+						description: "Tags for the note",
 					},
 				},
-				{
-					name: "create_note",
-					description:
-						"Create a new note (LLM Should call get_note_type_info first)",
-					inputSchema: {
-						type: "object",
-						properties: {
-							type: {
-								type: "string",
-								description: "Note type",
-							},
-							deck: {
-								type: "string",
-								description: "Deck name",
-							},
-							fields: {
-								type: "object",
-								description:
-									"Custom fields for the note(get note type info first)",
-								additionalProperties: true,
-							},
-							allowDuplicate: {
-								type: "boolean",
-								description: "Whether to allow duplicate notes",
-							},
-							tags: {
-								type: "array",
-								items: {
+				required: ["type", "deck", "fields"],
+			},
+		},
+		{
+			name: "batch_create_notes",
+			description:
+				"Create multiple notes at once (llm should call get_note_type_info first )",
+			inputSchema: {
+				type: "object",
+				properties: {
+					notes: {
+						type: "array",
+						items: {
+							type: "object",
+							properties: {
+								type: {
 									type: "string",
+									enum: ["Basic", "Cloze"],
 								},
-								description: "Tags for the note",
-							},
-						},
-						required: ["type", "deck", "fields"],
-					},
-				},
-				{
-					name: "batch_create_notes",
-					description:
-						"Create multiple notes at once (llm should call get_note_type_info first )",
-					inputSchema: {
-						type: "object",
-						properties: {
-							notes: {
-								type: "array",
-								items: {
+								deck: {
+									type: "string",
+								},
+								fields: {
 									type: "object",
-									properties: {
-										type: {
-											type: "string",
-											enum: ["Basic", "Cloze"],
-										},
-										deck: {
-											type: "string",
-										},
-										fields: {
-											type: "object",
-											additionalProperties: true,
-										},
-										tags: {
-											type: "array",
-											items: {
-												type: "string",
-											},
-										},
+									additionalProperties: true,
+								},
+								tags: {
+									type: "array",
+									items: {
+										type: "string",
 									},
-									required: ["type", "deck", "fields"],
 								},
 							},
-							allowDuplicate: {
-								type: "boolean",
-								description: "Whether to allow duplicate notes",
-							},
-							stopOnError: {
-								type: "boolean",
-								description: "Whether to stop on first error",
-							},
+							required: ["type", "deck", "fields"],
 						},
-						required: ["notes"],
 					},
-				},
-				{
-					name: "search_notes",
-					description: "Search for notes using Anki query syntax",
-					inputSchema: {
-						type: "object",
-						properties: {
-							query: {
-								type: "string",
-								description: "Anki search query",
-							},
-						},
-						required: ["query"],
+					allowDuplicate: {
+						type: "boolean",
+						description: "Whether to allow duplicate notes",
+					},
+					stopOnError: {
+						type: "boolean",
+						description: "Whether to stop on first error",
 					},
 				},
-				{
-					name: "get_note_info",
-					description: "Get detailed information about a note",
-					inputSchema: {
-						type: "object",
-						properties: {
-							noteId: {
-								type: "number",
-								description: "Note ID",
-							},
-						},
-						required: ["noteId"],
+				required: ["notes"],
+			},
+		},
+		{
+			name: "search_notes",
+			description: "Search for notes using Anki query syntax",
+			inputSchema: {
+				type: "object",
+				properties: {
+					query: {
+						type: "string",
+						description: "Anki search query",
 					},
 				},
-				{
-					name: "update_note",
-					description: "Update an existing note",
-					inputSchema: {
-						type: "object",
-						properties: {
-							id: {
-								type: "number",
-								description: "Note ID",
-							},
-							fields: {
-								type: "object",
-								description: "Fields to update",
-							},
-							tags: {
-								type: "array",
-								items: {
-									type: "string",
-								},
-								description: "New tags for the note",
-							},
-						},
-						required: ["id", "fields"],
+				required: ["query"],
+			},
+		},
+		{
+			name: "get_note_info",
+			description: "Get detailed information about a note",
+			inputSchema: {
+				type: "object",
+				properties: {
+					noteId: {
+						type: "number",
+						description: "Note ID",
 					},
 				},
-				{
-					name: "delete_note",
-					description: "Delete a note",
-					inputSchema: {
+				required: ["noteId"],
+			},
+		},
+		{
+			name: "update_note",
+			description: "Update an existing note",
+			inputSchema: {
+				type: "object",
+				properties: {
+					id: {
+						type: "number",
+						description: "Note ID",
+					},
+					fields: {
 						type: "object",
-						properties: {
-							noteId: {
-								type: "number",
-								description: "Note ID to delete",
-							},
+						description: "Fields to update",
+					},
+					tags: {
+						type: "array",
+						items: {
+							type: "string",
 						},
-						required: ["noteId"],
+						description: "New tags for the note",
 					},
 				},
-				{
-					name: "list_note_types",
-					description: "List all available note types",
-					inputSchema: {
-						type: "object",
-						properties: {},
-						required: [],
+				required: ["id", "fields"],
+			},
+		},
+		{
+			name: "delete_note",
+			description: "Delete a note",
+			inputSchema: {
+				type: "object",
+				properties: {
+					noteId: {
+						type: "number",
+						description: "Note ID to delete",
 					},
 				},
-				{
-					name: "create_note_type",
-					description: "Create a new note type",
-					inputSchema: {
-						type: "object",
-						properties: {
-							name: {
-								type: "string",
-								description: "Name of the new note type",
-							},
-							fields: {
-								type: "array",
-								items: {
+				required: ["noteId"],
+			},
+		},
+		{
+			name: "list_note_types",
+			description: "List all available note types",
+			inputSchema: {
+				type: "object",
+				properties: {},
+				required: [],
+			},
+		},
+		{
+			name: "create_note_type",
+			description: "Create a new note type",
+			inputSchema: {
+				type: "object",
+				properties: {
+					name: {
+						type: "string",
+						description: "Name of the new note type",
+					},
+					fields: {
+						type: "array",
+						items: {
+							type: "string",
+						},
+						description: "Field names for the note type",
+					},
+					css: {
+						type: "string",
+						description: "CSS styling for the note type",
+					},
+					templates: {
+						type: "array",
+						items: {
+							type: "object",
+							properties: {
+								name: {
 									type: "string",
 								},
-								description: "Field names for the note type",
-							},
-							css: {
-								type: "string",
-								description: "CSS styling for the note type",
-							},
-							templates: {
-								type: "array",
-								items: {
-									type: "object",
-									properties: {
-										name: {
-											type: "string",
-										},
-										front: {
-											type: "string",
-										},
-										back: {
-											type: "string",
-										},
-									},
-									required: ["name", "front", "back"],
+								front: {
+									type: "string",
+								},
+								back: {
+									type: "string",
 								},
-								description: "Card templates",
 							},
+							required: ["name", "front", "back"],
 						},
-						required: ["name", "fields", "templates"],
+						description: "Card templates",
 					},
 				},
-			],
-		};
+				required: ["name", "fields", "templates"],
+			},
+		},
+	],
+});
+
+/**
+ * Check a note against the batch_create_notes item schema
+ *
+ * @param note Note from the batch
+ * @param models Names of the models that exist in Anki
+ * @returns Why the note cannot be created, or null if it is valid
+ */
+function validateBatchNote(
+	note: any,
+	models: ReadonlySet<string>,
+): string | null {
+	if (!note || typeof note.type !== "string" || !note.type) {
+		return "Note type is required";
+	}
+	if (typeof note.deck !== "string" || !note.deck) {
+		return "Deck name is required";
+	}
+	if (
+		!note.fields ||
+		typeof note.fields !== "object" ||
+		Object.keys(note.fields).length === 0
+	) {
+		return "Fields are required";
+	}
+	if (
+		note.tags != null &&
+		!(
+			Array.isArray(note.tags) &&
+			note.tags.every((tag: unknown) => typeof tag === "string")
+		)
+	) {
+		return "Tags must be an array of strings";
+	}
+	if (!models.has(note.type)) {
+		return `Note type not found: ${note.type}`;
+	}
+	return null;
+}
+
+/**
+ * Handles all MCP tool operations for Anki
+ */
+export class McpToolHandler {
+	private ankiClient: AnkiClient;
+
+	constructor() {
+		this.ankiClient = new AnkiClient();
+	}
+
+	/**
+	 * Get tool schema for all available tools
+	 */
+	async getToolSchema(): Promise<{
+		tools: {
+			name: string;
+			description: string;
+			inputSchema: Record<string, any>;
+		}[];
+	}> {
+		return TOOL_SCHEMA;
 	}
 
 	/**
@@ -285,8 +355,6 @@ export class McpToolHandler {
 		}[];
 		isError?: boolean;
 	}> {
-		await this.ankiClient.checkConnection();
-
 		try {
 			switch (name) {
 				// Deck tools
@@ -319,9 +387,9 @@ export class McpToolHandler {
 
 				// Dynamic model-specific note creation
 				default:
-					const typeToolMatch = name.match(/^create_(.+)_note$/);
+					const typeToolMatch = name.match(MODEL_NOTE_TOOL_PATTERN);
 					if (typeToolMatch) {
-						const modelName = typeToolMatch[1].replace(/_/g, " ");
+						const modelName = typeToolMatch[1].replace(UNDERSCORE_PATTERN, " ");
 						return this.createModelSpecificNote(modelName, args);
 					}
 
@@ -554,13 +622,7 @@ export class McpToolHandler {
 			throw new McpError(ErrorCode.InvalidParams, "Fields are required");
 		}
 
-		// Check if deck exists, create if not
-		const decks = await this.ankiClient.getDeckNames();
-		if (!decks.includes(args.deck)) {
-			await this.ankiClient.createDeck(args.deck);
-		}
-
-		// Check if model exists
+		// Check if model exists before touching decks
 		const models = await this.ankiClient.getModelNames();
 		if (!models.includes(args.type)) {
 			throw new McpError(
@@ -569,6 +631,12 @@ export class McpToolHandler {
 			);
 		}
 
+		// Check if deck exists, create if not
+		const decks = await this.ankiClient.getDeckNames();
+		if (!decks.includes(args.deck)) {
+			await this.ankiClient.createDeck(args.deck);
+		}
+
 		// Normalize field names to match the model
 		const modelFields = await this.ankiClient.getModelFieldNames(args.type);
 		const normalizedFields: Record<string, string> = {};
@@ -701,28 +769,52 @@ export class McpToolHandler {
 			error?: string;
 			index: number;
 		}[] = [];
+		let successful = 0;
 
 		const stopOnError = args.stopOnError !== false;
 
+		// Fetch decks and models once for the whole batch
+		const [deckNames, modelNames] = await Promise.all([
+			this.ankiClient.getDeckNames(),
+			this.ankiClient.getModelNames(),
+		]);
+		const decks = new Set(deckNames);
+		const models = new Set(modelNames);
+		const modelFieldsCache = new Map<string, string[]>();
+
 		// Process each note
 		for (let i = 0; i < args.notes.length; i++) {
 			const note = args.notes[i];
+
+			// Record invalid notes directly instead of throwing and catching
+			const invalidReason = validateBatchNote(note, models);
+			if (invalidReason) {
+				results.push({
+					success: false,
+					error: invalidReason,
+					index: i,
+				});
+
+				if (stopOnError) {
+					break;
+				}
+				continue;
+			}
+
 			try {
 				// Check if deck exists, create if not
-				const decks = await this.ankiClient.getDeckNames();
-				if (!decks.includes(note.deck)) {
+				if (!decks.has(note.deck)) {
 					await this.ankiClient.createDeck(note.deck);
+					decks.add(note.deck);
 				}
 
-				// Check if model exists
-				const models = await this.ankiClient.getModelNames();
-				if (!models.includes(note.type)) {
-					throw new Error(`Note type not found: ${note.type}`);
+				// Get model fields, reusing them for notes of the same type
+				let modelFields = modelFieldsCache.get(note.type);
+				if (!modelFields) {
+					modelFields = await this.ankiClient.getModelFieldNames(note.type);
+					modelFieldsCache.set(note.type, modelFields);
 				}
 
-				// Get model fields
-				const modelFields = await this.ankiClient.getModelFieldNames(note.type);
-
 				// Normalize field names to match the model, all fields can be empty
 				const normalizedFields: Record<string, string> = {};
 				for (const field of modelFields) {
@@ -745,6 +837,7 @@ export class McpToolHandler {
 					noteId,
 					index: i,
 				});
+				successful++;
 			} catch (error) {
 				results.push({
 					success: false,
@@ -766,8 +859,8 @@ export class McpToolHandler {
 						{
 							results,
 							total: args.notes.length,
-							successful: results.filter((r) => r.success).length,
-							failed: results.filter((r) => !r.success).length,
+							successful,
+							failed: results.length - successful,
 						},
 						null,
 						2,
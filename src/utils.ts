@@ -1,7 +1,7 @@
 /**
  * Utility functions and anti-corruption layer for yanki-connect
  */
-import { YankiConnect } from "yanki-connect";
+import type { YankiConnect } from "yanki-connect";
 import { ErrorCode, McpError } from "@modelcontextprotocol/sdk/types.js";
 
 /**
@@ -58,7 +58,7 @@ export const DEFAULT_CONFIG: AnkiConfig = {
  * Provides a stable interface to interact with Anki
  */
 export class AnkiClient {
-	private client: YankiConnect;
+	private clientPromise: Promise<YankiConnect> | null;
 	private config: AnkiConfig;
 
 	/**
@@ -68,27 +68,43 @@ export class AnkiClient {
 	 */
 	constructor(config: Partial<AnkiConfig> = {}) {
 		this.config = { ...DEFAULT_CONFIG, ...config };
-		this.client = new YankiConnect();
+		this.clientPromise = null;
+	}
+
+	/**
+	 * Get the yanki-connect client, loading the library on first use
+	 *
+	 * Concurrent callers share one pending load, so only one client is created.
+	 */
+	private getClient(): Promise<YankiConnect> {
+		if (!this.clientPromise) {
+			this.clientPromise = import("yanki-connect").then(
+				({ YankiConnect }) => new YankiConnect(),
+			);
+		}
+		return this.clientPromise;
 	}
 
 	/**
 	 * Execute a request with retry logic
 	 *
-	 * @param operation Function to execute
+	 * @param operation Function to execute with the yanki-connect client
 	 * @param maxRetries Maximum number of retries
 	 * @returns Promise with the result
 	 */
 	private async executeWithRetry<T>(
-		operation: () => Promise<T>,
+		operation: (client: YankiConnect) => Promise<T>,
 		maxRetries = 1,
 	): Promise<T> {
-		let lastError: Error | null = null;
+		let lastError: unknown = null;
 
 		for (let attempt = 0; attempt <= maxRetries; attempt++) {
 			try {
-				return await operation();
+				// Load failures are normalized like request failures
+				return await operation(await this.getClient());
 			} catch (error) {
-				lastError = this.normalizeError(error);
+				// Only the final error is thrown, so normalize it once below
+				lastError = error;
 
 				// Don't wait on the last attempt
 				if (attempt < maxRetries) {
@@ -103,7 +119,7 @@ export class AnkiClient {
 		}
 
 		// If we get here, all attempts failed
-		throw lastError || new AnkiConnectionError("Unknown error occurred");
+		throw this.normalizeError(lastError);
 	}
 
 	/**
@@ -169,9 +185,9 @@ export class AnkiClient {
 	async checkConnection(): Promise<boolean> {
 		try {
 			// Use a direct axios call to check connection since version() is private
-			await this.executeWithRetry(() =>
+			await this.executeWithRetry((client) =>
 				// @ts-ignore - yanki-connect type definitions are incomplete
-				this.client.invoke("version"),
+				client.invoke("version"),
 			);
 			return true;
 		} catch (error) {
@@ -186,7 +202,7 @@ export class AnkiClient {
 	 */
 	async getDeckNames(): Promise<string[]> {
 		try {
-			return await this.executeWithRetry(() => this.client.deck.deckNames());
+			return await this.executeWithRetry((client) => client.deck.deckNames());
 		} catch (error) {
 			throw this.wrapError(
 				error instanceof Error ? error : new Error(String(error)),
@@ -199,8 +215,8 @@ export class AnkiClient {
 	 */
 	async createDeck(name: string): Promise<number> {
 		try {
-			const result = await this.executeWithRetry(() =>
-				this.client.deck.createDeck({ deck: name }),
+			const result = await this.executeWithRetry((client) =>
+				client.deck.createDeck({ deck: name }),
 			);
 			// Convert to number if needed
 			return typeof result === "number" ? result : 0;
@@ -216,7 +232,7 @@ export class AnkiClient {
 	 */
 	async getModelNames(): Promise<string[]> {
 		try {
-			return await this.executeWithRetry(() => this.client.model.modelNames());
+			return await this.executeWithRetry((client) => client.model.modelNames());
 		} catch (error) {
 			throw this.wrapError(
 				error instanceof Error ? error : new Error(String(error)),
@@ -229,8 +245,8 @@ export class AnkiClient {
 	 */
 	async getModelFieldNames(modelName: string): Promise<string[]> {
 		try {
-			return await this.executeWithRetry(() =>
-				this.client.model.modelFieldNames({ modelName }),
+			return await this.executeWithRetry((client) =>
+				client.model.modelFieldNames({ modelName }),
 			);
 		} catch (error) {
 			throw this.wrapError(
@@ -246,8 +262,8 @@ export class AnkiClient {
 		modelName: string,
 	): Promise<Record<string, { Front: string; Back: string }>> {
 		try {
-			return await this.executeWithRetry(() =>
-				this.client.model.modelTemplates({ modelName }),
+			return await this.executeWithRetry((client) =>
+				client.model.modelTemplates({ modelName }),
 			);
 		} catch (error) {
 			throw this.wrapError(
@@ -261,8 +277,8 @@ export class AnkiClient {
 	 */
 	async getModelStyling(modelName: string): Promise<{ css: string }> {
 		try {
-			return await this.executeWithRetry(() =>
-				this.client.model.modelStyling({ modelName }),
+			return await this.executeWithRetry((client) =>
+				client.model.modelStyling({ modelName }),
 			);
 		} catch (error) {
 			throw this.wrapError(
@@ -284,8 +300,8 @@ export class AnkiClient {
 		};
 	}): Promise<number | null> {
 		try {
-			return await this.executeWithRetry(() =>
-				this.client.note.addNote({
+			return await this.executeWithRetry((client) =>
+				client.note.addNote({
 					note: {
 						deckName: params.deckName,
 						modelName: params.modelName,
@@ -317,8 +333,8 @@ export class AnkiClient {
 		}[],
 	): Promise<(string | null)[] | null> {
 		try {
-			return await this.executeWithRetry(() =>
-				this.client.note.addNotes({
+			return await this.executeWithRetry((client) =>
+				client.note.addNotes({
 					notes: notes.map((note) => ({
 						deckName: note.deckName,
 						modelName: note.modelName,
@@ -343,8 +359,8 @@ export class AnkiClient {
 	 */
 	async findNotes(query: string): Promise<number[]> {
 		try {
-			const result = await this.executeWithRetry(() =>
-				this.client.note.findNotes({ query }),
+			const result = await this.executeWithRetry((client) =>
+				client.note.findNotes({ query }),
 			);
 			// Ensure we return an array of numbers
 			return (
@@ -371,8 +387,8 @@ export class AnkiClient {
 		}[]
 	> {
 		try {
-			const result = await this.executeWithRetry(() =>
-				this.client.note.notesInfo({ notes: ids }),
+			const result = await this.executeWithRetry((client) =>
+				client.note.notesInfo({ notes: ids }),
 			);
 			// Ensure we return a valid array
 			return (Array.isArray(result) ? result : []) as {
@@ -396,8 +412,8 @@ export class AnkiClient {
 		fields: Record<string, string>;
 	}): Promise<void> {
 		try {
-			await this.executeWithRetry(() =>
-				this.client.note.updateNoteFields({
+			await this.executeWithRetry((client) =>
+				client.note.updateNoteFields({
 					note: {
 						id: params.id,
 						fields: params.fields,
@@ -416,8 +432,8 @@ export class AnkiClient {
 	 */
 	async deleteNotes(ids: number[]): Promise<void> {
 		try {
-			await this.executeWithRetry(() =>
-				this.client.note.deleteNotes({ notes: ids }),
+			await this.executeWithRetry((client) =>
+				client.note.deleteNotes({ notes: ids }),
 			);
 		} catch (error) {
 			throw this.wrapError(
@@ -447,8 +463,8 @@ export class AnkiClient {
 				Back: template.back,
 			}));
 
-			await this.executeWithRetry(() =>
-				this.client.model.createModel({
+			await this.executeWithRetry((client) =>
+				client.model.createModel({
 					modelName: params.modelName,
 					inOrderFields: params.inOrderFields,
 					css: params.css,